@@ -12,8 +12,11 @@
 - Slow effect lasts 12 seconds when picking the hourglass (slow) item
 - Near-shot bomb bonus: if a bomb is shot <= 20 px above the paddle, +10 pts; else +1
 - Always shoot (SPACE), ammo cap = 3
+- Spawn rules (kind weights, interval curve, scale range, scripted waves) are read
+  from ./spawn_rules.json if present; otherwise built-in defaults are used.
 """
 
+import json
 import os
 import random
 import sys
@@ -28,6 +31,9 @@ USE_GLOW = False  # <- disable ALL additive glow halos
 W, H = 1280, 720
 FPS = 60
 SPAWN_MS = 720
+SPAWN_MIN_MS = 420
+SPAWN_DECAY = 0.94
+SCALE_RANGE = (0.7, 1.4)
 LEVEL_UP_EVERY = 10
 MAX_LIVES = 5
 AMMO_MAX = 3
@@ -59,6 +65,8 @@ ASSET_PATHS = {
     AMMO: os.path.join("assets", "ammo.png"),
 }
 
+SPAWN_RULES_PATH = "spawn_rules.json"
+
 # kind -> {"surf": Surface, "glow_color": (r,g,b)|None, "base_w": int}
 BASE_ART = {}
 
@@ -231,7 +239,7 @@ class Player(pygame.sprite.Sprite):
 
 
 class Falling(pygame.sprite.Sprite):
-    def __init__(self, kind, level=1):
+    def __init__(self, kind, level=1, scale=None):
         super().__init__()
         self.kind = kind
         self.level = level
@@ -241,7 +249,8 @@ class Falling(pygame.sprite.Sprite):
         glow_color = base["glow_color"]
         base_w = base["base_w"]
 
-        self.scale = random.uniform(0.7, 1.4)
+        self.scale = random.uniform(
+            *SCALE_RANGE) if scale is None else scale
         new_w = max(12, int(base_surf.get_width() * self.scale))
         new_h = max(12, int(base_surf.get_height() * self.scale))
         self.image = pygame.transform.smoothscale(base_surf, (new_w, new_h))
@@ -354,6 +363,151 @@ class RadialGlow(pygame.sprite.Sprite):
         if self.life <= 0:
             self.kill()
 
+# ---------- Spawn rules ----------
+
+
+def default_spawn_rules():
+    levels = []
+    for level in range(1, 14):
+        p_bomb = clamp(0.20 + level * 0.02, 0.20, 0.45)
+        levels.append({"from": level, "weights": {
+            TREASURE: 1.0 - (p_bomb + 0.20), BOMB: p_bomb,
+            HEART: 0.06, HOURGLASS: 0.07, AMMO: 0.07}})
+    return {
+        "interval": {"base_ms": SPAWN_MS, "decay": SPAWN_DECAY, "min_ms": SPAWN_MIN_MS},
+        "scale": list(SCALE_RANGE),
+        "batch": 1,
+        "levels": levels,
+        "waves": [],
+    }
+
+
+def load_spawn_rules(path=SPAWN_RULES_PATH):
+    rules = default_spawn_rules()
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            rules.update(json.load(fh))
+    return rules
+
+
+class AliasTable:
+    """Weighted kind picker (Vose alias method): O(n) build, O(1) pick."""
+
+    def __init__(self, weights):
+        items = [(k, float(w)) for k, w in weights.items() if w > 0]
+        for kind, _ in items:
+            if kind not in ASSET_PATHS:
+                raise ValueError(f"unknown item kind in spawn rules: {kind!r}")
+        if not items:
+            raise ValueError("spawn weights need at least one positive entry")
+        n = len(items)
+        total = sum(w for _, w in items)
+        self.kinds = [k for k, _ in items]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        scaled = [w * n / total for _, w in items]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def pick(self):
+        i = int(random.random() * len(self.kinds))
+        return self.kinds[i] if random.random() < self.prob[i] else self.kinds[self.alias[i]]
+
+
+class SpawnScheduler:
+    """Compiles spawn rules into per-level alias tables and tick schedules.
+
+    tick() is called once per simulated frame and returns the (kind, scale)
+    pairs to spawn on that frame; scripted waves are queued by absolute tick
+    when their level is reached, so each frame costs O(1) plus its batch.
+    """
+
+    def __init__(self, rules, fps=FPS):
+        self.fps = fps
+        interval = rules.get("interval", {})
+        self.base_ms = interval.get("base_ms", SPAWN_MS)
+        self.decay = interval.get("decay", SPAWN_DECAY)
+        self.min_ms = interval.get("min_ms", SPAWN_MIN_MS)
+        scale = tuple(rules.get("scale", SCALE_RANGE))
+        batch = int(rules.get("batch", 1))
+
+        entries = sorted(rules["levels"], key=lambda e: e["from"])
+        if not entries:
+            raise ValueError("spawn rules need at least one level entry")
+        compiled = [(e["from"], {
+            "table": AliasTable(e["weights"]),
+            "scale": tuple(e.get("scale", scale)),
+            "batch": int(e.get("batch", batch)),
+            "interval_ms": e.get("interval_ms"),
+        }) for e in entries]
+        # level -> plan, expanded up to the last "from"; higher levels reuse the last plan
+        self.plans = []
+        for level in range(1, compiled[-1][0] + 1):
+            plan = compiled[0][1]
+            for start, p in compiled:
+                if start <= level:
+                    plan = p
+            self.plans.append(plan)
+
+        # level -> [(tick offsets, batch, table|None, scale)]
+        self.waves = {}
+        for w in rules.get("waves", []):
+            start = self.ms_to_ticks(w.get("start_ms", 0), minimum=0)
+            every = self.ms_to_ticks(w.get("every_ms", 0), minimum=0)
+            offsets = [start + i * every for i in range(int(w.get("repeat", 1)))]
+            table = AliasTable(w["weights"]) if "weights" in w else None
+            self.waves.setdefault(w["at_level"], []).append(
+                (offsets, int(w.get("batch", 1)), table, tuple(w["scale"]) if "scale" in w else None))
+
+        self.reset()
+
+    def ms_to_ticks(self, ms, minimum=1):
+        return max(minimum, int(round(ms * self.fps / 1000.0)))
+
+    def reset(self):
+        self.ticks = 0
+        self.level = 0
+        self.pending = {}  # absolute tick -> [(batch, table, scale)]
+        self.set_level(1)
+
+    def set_level(self, level):
+        for lv in range(self.level + 1, level + 1):
+            for offsets, batch, table, scale in self.waves.get(lv, ()):
+                for off in offsets:
+                    self.pending.setdefault(self.ticks + off + 1, []).append(
+                        (batch, table, scale))
+        self.level = max(self.level, level)
+        self.plan = self.plans[min(self.level, len(self.plans)) - 1]
+        interval_ms = self.plan["interval_ms"]
+        if interval_ms is None:
+            interval_ms = max(self.min_ms, int(
+                self.base_ms * (self.decay ** (self.level - 1))))
+        self.interval = self.ms_to_ticks(interval_ms)
+        self.countdown = self.interval
+
+    def emit(self, out, batch, table, scale):
+        table = table or self.plan["table"]
+        lo, hi = scale or self.plan["scale"]
+        for _ in range(batch):
+            out.append((table.pick(), random.uniform(lo, hi)))
+
+    def tick(self):
+        self.ticks += 1
+        out = []
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.countdown = self.interval
+            self.emit(out, self.plan["batch"], None, None)
+        for batch, table, scale in self.pending.pop(self.ticks, ()):
+            self.emit(out, batch, table, scale)
+        return out
+
 # ---------- Game ----------
 
 
@@ -402,8 +556,7 @@ class Game:
         self.SLOW_FRAMES = int(FPS * SLOW_SECONDS)   # 12 seconds
         self.slow_factor = SLOW_FACTOR
 
-        self.SPAWN_EVENT = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.SPAWN_EVENT, SPAWN_MS)
+        self.spawner = SpawnScheduler(load_spawn_rules())
 
         self.bg_color = (16, 20, 30)
         self.starfield = self.make_starfield()
@@ -455,35 +608,19 @@ class Game:
         self.game_over = False
         self.slow_timer = 0
         self.ammo = 0
-        pygame.time.set_timer(self.SPAWN_EVENT, SPAWN_MS)
+        self.spawner.reset()
 
     def spawn(self):
-        p_bomb = clamp(0.20 + self.level * 0.02, 0.20, 0.45)
-        p_heart = 0.06
-        p_hourglass = 0.07
-        p_ammo = 0.07
-        p_treasure = 1.0 - (p_bomb + p_heart + p_hourglass + p_ammo)
-        r = random.random()
-        if r < p_bomb:
-            kind = BOMB
-        elif r < p_bomb + p_heart:
-            kind = HEART
-        elif r < p_bomb + p_heart + p_hourglass:
-            kind = HOURGLASS
-        elif r < p_bomb + p_heart + p_hourglass + p_ammo:
-            kind = AMMO
-        else:
-            kind = TREASURE
-        f = Falling(kind, self.level)
-        self.falls.add(f)
-        self.all_sprites.add(f)
+        for kind, scale in self.spawner.tick():
+            f = Falling(kind, self.level, scale)
+            self.falls.add(f)
+            self.all_sprites.add(f)
 
     def level_check(self):
         new_level = 1 + self.score // LEVEL_UP_EVERY
         if new_level > self.level:
             self.level = new_level
-            interval = max(420, int(SPAWN_MS * (0.94 ** (self.level - 1))))
-            pygame.time.set_timer(self.SPAWN_EVENT, interval)
+            self.spawner.set_level(self.level)
 
     def explosion_at(self, x, y):
         if USE_GLOW:
@@ -607,13 +744,12 @@ class Game:
                         self.try_shoot()
                     if e.key == pygame.K_f:
                         self.toggle_fullscreen()
-                elif e.type == self.SPAWN_EVENT and not (self.paused or self.game_over):
-                    self.spawn()
 
             keys = pygame.key.get_pressed()
 
             if not self.paused and not self.game_over:
                 self.player.update(keys)
+                self.spawn()
 
                 slow = 1.0
                 if self.slow_timer > 0: